@@ -1,6 +1,8 @@
 """Kelly criterion utilities."""
 from __future__ import annotations
 
+import numpy as np
+
 
 def kelly_fraction(p_win: float, odds_decimal: float) -> float:
     """Return optimal fraction of bankroll according to Kelly.
@@ -14,3 +16,10 @@ def kelly_fraction(p_win: float, odds_decimal: float) -> float:
     if edge <= 0:
         return 0.0
     return edge / b
+
+
+def kelly_fraction_array(p_win: np.ndarray, odds_decimal: np.ndarray) -> np.ndarray:
+    """Vectorised :func:`kelly_fraction` over arrays of probabilities and odds."""
+    b = odds_decimal - 1.0
+    edge = p_win * (b + 1) - 1
+    return np.divide(edge, b, out=np.zeros_like(edge, dtype=float), where=edge > 0)
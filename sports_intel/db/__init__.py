@@ -1,12 +1,37 @@
 """Database engine and models."""
 from __future__ import annotations
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from sports_intel.core.settings import settings
 
+# Per-connection SQLite tuning: WAL + NORMAL sync drops the fsync on every
+# commit, temp tables (ingest staging) stay in RAM, a 64 MiB page cache, and
+# reads of the first 256 MiB go through mmap instead of read() syscalls.
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-65536",
+    "mmap_size=268435456",
+)
+
 engine = create_engine(settings.database_url, echo=False, future=True)
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+# Sessions are short-lived read-then-bulk-write units: no autoflush, and loaded
+# objects stay usable after commit instead of being expired and re-SELECTed.
+SessionLocal = sessionmaker(
+    bind=engine, autocommit=False, autoflush=False, expire_on_commit=False, future=True
+)
 
 Base = declarative_base()
+
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _conn_record) -> None:
+        cursor = dbapi_conn.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
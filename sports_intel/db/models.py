@@ -5,7 +5,7 @@ import datetime as dt
 from enum import Enum
 from typing import Optional, List, Union
 
-from sqlalchemy import BigInteger, Date, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import BigInteger, Date, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from sports_intel.db import Base
@@ -29,6 +29,10 @@ class Team(Base):
     __table_args__ = (UniqueConstraint("name", "league", name="uq_team_name_league"),)
 
 
+# Case-insensitive exact lookups by team name (ingest providers map names -> ids)
+Index("ix_teams_name_lower", func.lower(Team.name))
+
+
 class Player(Base):
     __tablename__ = "players"
 
@@ -46,10 +50,10 @@ class Game(Base):
     __tablename__ = "games"
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     ext_game_id: Mapped[Optional[int]] = mapped_column(BigInteger, unique=True)
-    season: Mapped[int] = mapped_column(Integer, index=True)
+    season: Mapped[int] = mapped_column(Integer)
     date: Mapped[dt.date] = mapped_column(Date, index=True)
-    home_team_id: Mapped[int] = mapped_column(ForeignKey("teams.id"))
-    away_team_id: Mapped[int] = mapped_column(ForeignKey("teams.id"))
+    home_team_id: Mapped[int] = mapped_column(ForeignKey("teams.id"), index=True)
+    away_team_id: Mapped[int] = mapped_column(ForeignKey("teams.id"), index=True)
     venue: Mapped[Optional[str]] = mapped_column(String(64))
     home_score: Mapped[Optional[int]] = mapped_column(Integer)
     away_score: Mapped[Optional[int]] = mapped_column(Integer)
@@ -61,6 +65,10 @@ class Game(Base):
             return None
         return self.home_team_id if self.home_score > self.away_score else self.away_team_id
 
+    # Season scans ordered by date read straight off the index (no sort step);
+    # also serves plain season lookups, so season needs no index of its own
+    __table_args__ = (Index("ix_games_season_date", "season", "date"),)
+
 
 class Bet(Base):
     __tablename__ = "bets"
@@ -94,4 +102,11 @@ class OddsLine(Base):
     # Avoid duplicate snapshots for same timestamp & keys
     __table_args__ = (
         UniqueConstraint("ts", "event_id", "market", "outcome", name="uq_odds_snapshot"),
+        # Dashboard market/sportsbook filters
+        Index("ix_odds_lines_market_sportsbook", "market", "sportsbook"),
     )
+
+
+# Latest-snapshot-per-game lookups match lower(market) exactly (rows ingested
+# before market names were normalised are mixed case) and sort by ts
+Index("ix_odds_lines_market_lower", func.lower(OddsLine.market), OddsLine.game_id, OddsLine.ts.desc())
@@ -19,6 +19,13 @@ _logger = logging.getLogger(__name__)
 # DraftKings sport id mapping – NBA = 42648 (US Sportsbook)
 NBA_SPORT_ID = 42648
 BASE_URL = "https://sportsbook.draftkings.com/sites/US-AZ-SB/api/v5/eventgroups/{sport_id}"
+# Canonical market name for full-game moneyline offers (what the simulator reads)
+MONEYLINE_MARKET = "moneyline"
+# Event-detail (category, subcategory) holding the full-game lines; halves and
+# quarters sit under other subcategories with the same "Moneyline" label
+_FULL_GAME_LINES = ("game lines", "game")
+# Rows per executemany batch when persisting odds
+_PERSIST_CHUNK = 1000
 
 class DraftKingsNBAOddsProvider(ProviderBase):
     """Pull moneyline / spread / total odds for NBA games."""
@@ -159,7 +166,7 @@ class DraftKingsNBAOddsProvider(ProviderBase):
                             "sportsbook": "DraftKings",
                             "event_id": event_id,
                             "game_id": game_id,
-                            "market": offer.get("label", subcat.get("name", "")),
+                            "market": self._normalize_market(offer.get("label", subcat.get("name", ""))),
                             "outcome": outcome.get("label"),
                             "line": outcome.get("line"),
                             "odds": self._to_decimal_odds(outcome.get("oddsAmerican")),
@@ -234,11 +241,20 @@ class DraftKingsNBAOddsProvider(ProviderBase):
                 cat_name = category.get("name", "")
                 for subcat in category.get("componentizedOfferCategories", []):
                     subcat_name = subcat.get("name", "")
+                    full_game = (
+                        self._normalize_market(cat_name),
+                        self._normalize_market(subcat_name),
+                    ) == _FULL_GAME_LINES
                     for offer_container in subcat.get("offerCategories", []):
                         for offer in offer_container.get("offers", []):
                             market_name = offer.get("label", "")
-                            # Create full market name with category context
-                            full_market = f"{cat_name} - {subcat_name} - {market_name}"
+                            if full_game and self._normalize_market(market_name) == MONEYLINE_MARKET:
+                                # Same canonical name as the day feed, so the
+                                # simulator's exact market match finds it
+                                full_market = MONEYLINE_MARKET
+                            else:
+                                # Create full market name with category context
+                                full_market = f"{cat_name} - {subcat_name} - {market_name}"
 
                             for outcome in offer.get("outcomes", []):
                                 rec = {
@@ -300,17 +316,21 @@ class DraftKingsNBAOddsProvider(ProviderBase):
 
     def _persist(self, df: pd.DataFrame) -> None:
         """Store odds data to database, ignoring any duplicate entries."""
+        if df.empty:
+            return
         if 'event_url' in df.columns:
             # Remove the event_url column before persisting since it's not in our model
             df = df.drop(columns=['event_url'])
+        cols = [c.name for c in OddsLine.__table__.columns if c.name in df.columns]
+        records = df[cols].astype(object).where(df[cols].notna(), None).to_dict(orient="records")
 
+        # One executemany per chunk instead of one INSERT statement per row.
+        # OR IGNORE (not ON CONFLICT DO NOTHING) so rows violating NOT NULL,
+        # e.g. suspended props without odds, are skipped like duplicates.
+        stmt = insert(OddsLine).prefix_with("OR IGNORE")
         with engine.begin() as conn:
-            for _, row in df.iterrows():
-                conn.execute(
-                    insert(OddsLine)
-                    .values(**row.to_dict())
-                    .prefix_with("OR IGNORE")
-                )
+            for start in range(0, len(records), _PERSIST_CHUNK):
+                conn.execute(stmt, records[start:start + _PERSIST_CHUNK])
 
     # ------------------------------------------------------------------
     # Utility helpers
@@ -325,6 +345,11 @@ class DraftKingsNBAOddsProvider(ProviderBase):
             return (american / 100) + 1
         return (100 / abs(american)) + 1
 
+    @staticmethod
+    def _normalize_market(label: str) -> str:
+        """Canonical market name, e.g. "Moneyline " -> "moneyline"."""
+        return label.strip().lower()
+
     @staticmethod
     def _parse_event_name(name: str) -> tuple[str | None, str | None]:
         # "Lakers @ Warriors" -> away, home
@@ -3,11 +3,13 @@ from __future__ import annotations
 
 import datetime as dt
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import ijson
 import requests
 import pandas as pd
-from typing import Iterable, Dict, Any, List
+from typing import Iterable, Dict, Any
 from sqlalchemy.dialects.sqlite import insert
-from sqlalchemy import select, update
+from sqlalchemy import func, select
 
 from sports_intel.ingest.provider_base import ProviderBase
 from sports_intel.db import engine
@@ -20,6 +22,13 @@ BASE_URL = "https://www.thesportsdb.com/api/v1/json/3"
 LEAGUE_ID = {
     "NBA": 4387,  # NBA League ID in TheSportsDB
 }
+# Bodies TheSportsDB returns for days without events
+_EMPTY_PAYLOADS = frozenset({b"", b"null", b'{"events":null}', b'{"events": null}'})
+# Concurrent roster requests during backfill
+_ROSTER_WORKERS = 8
+# Connection-local TEMP table used by _persist to bulk-load a frame before
+# upserting it (kept in RAM via temp_store=MEMORY, never touches the main schema)
+_STAGING_TABLE = "_stg_games"
 
 class TheSportsDBProvider(ProviderBase):
     """Pull sports data from TheSportsDB."""
@@ -40,6 +49,8 @@ class TheSportsDBProvider(ProviderBase):
             "Accept": "application/json",
         }
         self.session.headers.update(self.headers)
+        # Internal team id -> TheSportsDB team id; immutable within a session
+        self._ext_team_ids: Dict[int, int | None] = {}
 
     # ------------------------------------------------------------------
     # Provider implementation
@@ -57,12 +68,16 @@ class TheSportsDBProvider(ProviderBase):
             # We don't yield teams_df as it's not handled by the generic _persist method
 
         # Step 2: Get players for each team
-        team_ids = self._get_team_ids_from_db()
-        for team_id in team_ids:
-            players_df = self._fetch_players_for_team(team_id)
-            if not players_df.empty:
-                self._persist_players(players_df)
-                # We don't yield players_df as it's not handled by the generic _persist method
+        self._load_ext_team_ids()
+        team_ids = list(self._ext_team_ids)
+        # Roster calls are independent HTTP round-trips, so overlap them and
+        # persist every roster in one batch
+        with ThreadPoolExecutor(max_workers=_ROSTER_WORKERS) as executor:
+            futures = [executor.submit(self._fetch_players_for_team, team_id) for team_id in team_ids]
+            player_dfs = [df for df in (f.result() for f in as_completed(futures)) if not df.empty]
+        if player_dfs:
+            self._persist_players(pd.concat(player_dfs, ignore_index=True))
+            # We don't yield player frames as they're not handled by the generic _persist method
 
         # Step 3: Get games/events for the season
         season_str = f"{self.season}-{self.season + 1}"
@@ -72,11 +87,12 @@ class TheSportsDBProvider(ProviderBase):
             yield games_df
 
     def fetch_updates(self, days_ahead: int = 15) -> pd.DataFrame | None:
-        """Fetch latest upcoming games (next 25 events) using eventsnextleague endpoint."""
+        """Fetch latest upcoming games (next 25 events) using eventsnextleague endpoint.
+
+        Persisting is left to the caller (see ``update``).
+        """
         df = self._fetch_next_events()
         if df is not None and not df.empty:
-            # Persist inside fetch_updates so generic ProviderBase.update works too
-            self._persist(df)
             return df
         return pd.DataFrame()
 
@@ -91,6 +107,7 @@ class TheSportsDBProvider(ProviderBase):
         print(f"Fetching games between {start_date} and {end_date}")
         df = self.fetch_date_range(start_date, end_date)
         if df is not None and not df.empty:
+            print(f"Persisting {len(df)} game records...")
             self._persist(df)
 
     def fetch_game_details(self, game_id: str) -> pd.DataFrame:
@@ -261,7 +278,11 @@ class TheSportsDBProvider(ProviderBase):
                 print(f"Error response for {date_str}: {response.status_code}")
                 current += dt.timedelta(days=1)
                 continue
-            data = response.json()
+            # Off-season / idle days come back as a bare null payload; skip the parse
+            if response.content.strip() in _EMPTY_PAYLOADS:
+                current += dt.timedelta(days=1)
+                continue
+            data = response.json() or {}
             events = data.get("events") or []
             for event in events:
                 try:
@@ -297,11 +318,8 @@ class TheSportsDBProvider(ProviderBase):
             current += dt.timedelta(days=1)
         print(f"Finished fetching for date range. Total records processed: {len(records)}")
         if records:
-            df = pd.DataFrame(records)
-            print(f"Persisting {len(df)} game records...")
-            self._persist(df)
-            return df
-        print("No game records found to persist.")
+            return pd.DataFrame(records)
+        print("No game records found.")
         return pd.DataFrame()
 
     def _fetch_teams(self) -> pd.DataFrame:
@@ -381,76 +399,72 @@ class TheSportsDBProvider(ProviderBase):
                 "s": season
             }
             print(f"TheSportsDB API request: {url} with params {params}")
-            response = self.session.get(url, params=params)
-            print(f"TheSportsDB API response status: {response.status_code}")
-            
-            if response.status_code != 200:
-                _logger.error(f"Error response from TheSportsDB: {response.status_code} - {response.text}")
-                return pd.DataFrame()
-                
-            data = response.json()
-            
-            # Helpful debugging for API response structure
-            if "events" not in data:
-                print(f"No 'events' key in response data. Available keys: {list(data.keys())}")
-                if data:
-                    print(f"Sample of response data: {str(data)[:200]}...")
-                return pd.DataFrame()
-
-            events = data.get("events", [])
-            if not events:
-                print("No events found in the API response")
-                return pd.DataFrame()
-                
-            print(f"Found {len(events)} events from TheSportsDB")
-
-            records = []
-            for event in events:
-                try:
-                    event_date = dt.datetime.strptime(event.get("dateEvent", ""), "%Y-%m-%d").date()
-                    home_team_name = event.get("strHomeTeam", "")
-                    away_team_name = event.get("strAwayTeam", "")
+            # Stream the body so the (large) season payload is parsed event by
+            # event as it arrives instead of being materialised with .json()
+            with self.session.get(url, params=params, stream=True) as response:
+                print(f"TheSportsDB API response status: {response.status_code}")
+
+                if response.status_code != 200:
+                    _logger.error(f"Error response from TheSportsDB: {response.status_code} - {response.text}")
+                    return pd.DataFrame()
+
+                response.raw.decode_content = True
+                events = ijson.items(response.raw, "events.item")
+
+                records = []
+                n_events = 0
+                for event in events:
+                    n_events += 1
+                    try:
+                        event_date = dt.datetime.strptime(event.get("dateEvent", ""), "%Y-%m-%d").date()
+                        home_team_name = event.get("strHomeTeam", "")
+                        away_team_name = event.get("strAwayTeam", "")
 
-                    # Map to internal team IDs
-                    home_team_id = self._get_team_id_by_name(home_team_name)
-                    away_team_id = self._get_team_id_by_name(away_team_name)
+                        # Map to internal team IDs
+                        home_team_id = self._get_team_id_by_name(home_team_name)
+                        away_team_id = self._get_team_id_by_name(away_team_name)
 
-                    if not home_team_id or not away_team_id:
-                        # Try to create the teams first
-                        if not home_team_id:
-                            home_team_id = self._create_team_from_event(event, "home")
-                        if not away_team_id:
-                            away_team_id = self._create_team_from_event(event, "away")
-                            
                         if not home_team_id or not away_team_id:
-                            _logger.warning(f"Unable to map teams for event: {home_team_name} vs {away_team_name}")
-                            continue
-
-                    # Extract scores safely
-                    try:
-                        home_score = int(event.get("intHomeScore")) if event.get("intHomeScore") else None
-                    except (ValueError, TypeError):
-                        home_score = None
+                            # Try to create the teams first
+                            if not home_team_id:
+                                home_team_id = self._create_team_from_event(event, "home")
+                            if not away_team_id:
+                                away_team_id = self._create_team_from_event(event, "away")
+                            
+                            if not home_team_id or not away_team_id:
+                                _logger.warning(f"Unable to map teams for event: {home_team_name} vs {away_team_name}")
+                                continue
+
+                        # Extract scores safely
+                        try:
+                            home_score = int(event.get("intHomeScore")) if event.get("intHomeScore") else None
+                        except (ValueError, TypeError):
+                            home_score = None
                         
-                    try:
-                        away_score = int(event.get("intAwayScore")) if event.get("intAwayScore") else None
-                    except (ValueError, TypeError):
-                        away_score = None
+                        try:
+                            away_score = int(event.get("intAwayScore")) if event.get("intAwayScore") else None
+                        except (ValueError, TypeError):
+                            away_score = None
+
+                        record = {
+                            "ext_game_id": event.get("idEvent"),
+                            "season": self.season,
+                            "date": event_date,
+                            "home_team_id": home_team_id,
+                            "away_team_id": away_team_id,
+                            "venue": event.get("strVenue"),
+                            "home_score": home_score,
+                            "away_score": away_score,
+                        }
+                        records.append(record)
+                    except Exception as e:
+                        _logger.error(f"Error processing event {event.get('idEvent')}: {e}")
+                        continue
 
-                    record = {
-                        "ext_game_id": event.get("idEvent"),
-                        "season": self.season,
-                        "date": event_date,
-                        "home_team_id": home_team_id,
-                        "away_team_id": away_team_id,
-                        "venue": event.get("strVenue"),
-                        "home_score": home_score,
-                        "away_score": away_score,
-                    }
-                    records.append(record)
-                except Exception as e:
-                    _logger.error(f"Error processing event {event.get('idEvent')}: {e}")
-                    continue
+            if not n_events:
+                print("No events found in the API response")
+                return pd.DataFrame()
+            print(f"Found {n_events} events from TheSportsDB")
 
             df = pd.DataFrame(records)
             print(f"Processed {len(df)} valid games from TheSportsDB")
@@ -528,41 +542,34 @@ class TheSportsDBProvider(ProviderBase):
             _logger.warning(f"DataFrame doesn't contain game data, skipping persistence")
             return
 
-        # Ensure required columns are present
-        required_cols = ['ext_game_id', 'season', 'date', 'home_team_id', 'away_team_id']
-        
-        # Process records for upsert
-        records_to_upsert = []
-        for _, row in df.iterrows():
-            record = {k: v for k, v in row.to_dict().items() if k in Game.__table__.columns}
-            records_to_upsert.append(record)
-        
-        # Perform upsert
+        cols = [c.name for c in Game.__table__.columns if c.name in df.columns]
+        col_list = ", ".join(cols)
+        # Normalise timestamps (next-events feed) down to plain dates on the way in
+        select_list = ", ".join("date(date)" if c == "date" else c for c in cols)
+
+        # Stage the frame in one multi-row insert, then upsert it set-based in a
+        # single statement. Existing games only get their scores refreshed, and
+        # only when both scores are known.
         with engine.begin() as conn:
-            for record in records_to_upsert:
-                # Check if game exists
-                stmt = select(Game.id).where(Game.ext_game_id == record["ext_game_id"])
-                existing_game_id = conn.execute(stmt).scalar_one_or_none()
-
-                if existing_game_id:
-                    # Update existing game if scores are available
-                    if pd.notna(record.get("home_score")) and pd.notna(record.get("away_score")):
-                        conn.execute(
-                            update(Game)
-                            .where(Game.id == existing_game_id)
-                            .values(
-                                home_score=record["home_score"],
-                                away_score=record["away_score"]
-                            )
-                        )
-                else:
-                    # Insert new game
-                    conn.execute(
-                        insert(Game)
-                        .values(**record)
-                    )
-        
-        print(f"_persist successfully upserted {len(records_to_upsert)} records.")
+            df[cols].to_sql(
+                _STAGING_TABLE,
+                conn,
+                schema="temp",
+                if_exists="replace",
+                index=False,
+                method="multi",
+                chunksize=100,
+            )
+            conn.exec_driver_sql(
+                f"INSERT INTO {Game.__tablename__} ({col_list}) "
+                f"SELECT {select_list} FROM temp.{_STAGING_TABLE} WHERE true "
+                "ON CONFLICT(ext_game_id) DO UPDATE SET "
+                "home_score = excluded.home_score, away_score = excluded.away_score "
+                "WHERE excluded.home_score IS NOT NULL AND excluded.away_score IS NOT NULL"
+            )
+            conn.exec_driver_sql(f"DROP TABLE temp.{_STAGING_TABLE}")
+
+        print(f"_persist successfully upserted {len(df)} records.")
 
     def _persist_teams(self, df: pd.DataFrame) -> None:
         """Persist team records to the database."""
@@ -570,12 +577,7 @@ class TheSportsDBProvider(ProviderBase):
             return
 
         with engine.begin() as conn:
-            for _, row in df.iterrows():
-                conn.execute(
-                    insert(Team)
-                    .values(**row.to_dict())
-                    .prefix_with("OR IGNORE")
-                )
+            conn.execute(insert(Team).prefix_with("OR IGNORE"), self._table_records(df, Team))
 
     def _persist_players(self, df: pd.DataFrame) -> None:
         """Persist player records to the database."""
@@ -583,40 +585,43 @@ class TheSportsDBProvider(ProviderBase):
             return
 
         with engine.begin() as conn:
-            for _, row in df.iterrows():
-                conn.execute(
-                    insert(Player)
-                    .values(**row.to_dict())
-                    .prefix_with("OR IGNORE")
-                )
+            conn.execute(insert(Player).prefix_with("OR IGNORE"), self._table_records(df, Player))
 
     # ------------------------------------------------------------------
     # Utility helpers
     # ------------------------------------------------------------------
 
-    def _get_team_ids_from_db(self) -> List[int]:
-        """Get all team IDs from the database."""
-        with engine.begin() as conn:
-            result = conn.execute(select(Team.id))
-            return [row[0] for row in result]
+    @staticmethod
+    def _table_records(df: pd.DataFrame, model) -> list[dict[str, Any]]:
+        """Return *df* rows as insert dicts, keeping only columns of *model*'s table."""
+        cols = [c.name for c in model.__table__.columns if c.name in df.columns]
+        return df[cols].to_dict(orient="records")
 
     def _get_team_id_by_name(self, name: str) -> int | None:
-        """Look up team ID by name."""
+        """Look up team ID by exact (case-insensitive) name."""
         with engine.begin() as conn:
             result = conn.execute(
                 select(Team.id)
-                .where(Team.name.ilike(f"%{name}%"))
+                .where(func.lower(Team.name) == name.lower())
             ).scalar_one_or_none()
             return result
 
     def _get_ext_team_id(self, team_id: int) -> int | None:
-        """Get external team ID from internal ID."""
+        """Get external team ID from internal ID (cached per provider)."""
+        if team_id in self._ext_team_ids:
+            return self._ext_team_ids[team_id]
         with engine.begin() as conn:
             result = conn.execute(
                 select(Team.ext_team_id)
                 .where(Team.id == team_id)
             ).scalar_one_or_none()
-            return result
+        self._ext_team_ids[team_id] = result
+        return result
+
+    def _load_ext_team_ids(self) -> None:
+        """Prime the internal -> external team ID cache in one query."""
+        with engine.begin() as conn:
+            self._ext_team_ids = dict(conn.execute(select(Team.id, Team.ext_team_id)).all())
 
     @staticmethod
     def _parse_height(height_str: str) -> int | None:
@@ -3,9 +3,11 @@ from __future__ import annotations
 
 import typer
 import datetime as dt
+import os
+from concurrent.futures import ProcessPoolExecutor
 
-from sqlalchemy.orm import Session
 from sqlalchemy import select, func
+from sqlalchemy.dialects.sqlite import insert
 
 from sports_intel.db import engine, SessionLocal, Base
 from sports_intel.db.models import Game, Team
@@ -25,37 +27,72 @@ def simulate_season_cmd(
     """Simulate paper trading for a given season."""
     # ensure tables exist
     Base.metadata.create_all(bind=engine)
-    session: Session = SessionLocal()
-    # seed dummy games if requested and none exist
-    # Use direct COUNT() to avoid loading all columns
-    count = session.execute(
-        select(func.count()).select_from(Game).where(Game.season == season)
-    ).scalar_one()
-    if seed_games > 0 and count == 0:
-        teams = session.query(Team).all()
-        if len(teams) < 2:
-            # create two dummy teams
-            t1 = Team(name="Team A", league="NBA")
-            t2 = Team(name="Team B", league="NBA")
-            session.add_all([t1, t2])
-            session.commit()
-            teams = [t1, t2]
-        # seed games
-        for i in range(seed_games):
-            date = dt.date(season, 1, 1) + dt.timedelta(days=i)
-            game = Game(
-                ext_game_id=1000 + i,
-                season=season,
-                date=date,
-                home_team_id=teams[0].id,
-                away_team_id=teams[1].id,
-                venue="Simulator Arena",
+    with SessionLocal() as session:
+        # seed dummy games if requested and none exist
+        # Game and team counts in a single round-trip
+        counts = session.execute(
+            select(
+                select(func.count()).select_from(Game).where(Game.season == season).scalar_subquery().label("games"),
+                select(func.count()).select_from(Team).scalar_subquery().label("teams"),
             )
-            session.add(game)
-        session.commit()
-        typer.echo(f"Seeded {seed_games} dummy games for season {season}.")
-    session.close()
-    # run simulation
-    final_bankroll, stats = simulate_season(season, initial_bankroll)
+        ).one()
+        if seed_games > 0 and counts.games == 0:
+            if counts.teams < 2:
+                # create two dummy teams (no-op for whichever already exists)
+                session.execute(
+                    insert(Team)
+                    .values([{"name": "Team A", "league": "NBA"}, {"name": "Team B", "league": "NBA"}])
+                    .on_conflict_do_nothing()
+                )
+            team_ids = session.scalars(select(Team.id).order_by(Team.id).limit(2)).all()
+            # seed games (plain mappings, no ORM instances / identity map)
+            rows = [
+                {
+                    "ext_game_id": 1000 + i,
+                    "season": season,
+                    "date": dt.date(season, 1, 1) + dt.timedelta(days=i),
+                    "home_team_id": team_ids[0],
+                    "away_team_id": team_ids[1],
+                    "venue": "Simulator Arena",
+                }
+                for i in range(seed_games)
+            ]
+            session.bulk_insert_mappings(Game, rows)
+            session.commit()
+            typer.echo(f"Seeded {seed_games} dummy games for season {season}.")
+        # run simulation on the same session
+        final_bankroll, stats = simulate_season(season, initial_bankroll, session=session)
     typer.echo(f"Final bankroll: {final_bankroll:.2f}")
     typer.echo(f"Stats: {stats}")
+
+
+def _reset_engine_pool() -> None:
+    """Drop pooled connections inherited from the parent process (worker initializer)."""
+    engine.dispose(close=False)
+
+
+@paper_app.command("seasons")
+def simulate_seasons_cmd(
+    start_season: int = typer.Argument(..., help="First season to simulate, e.g. 2019"),
+    end_season: int = typer.Argument(..., help="Last season to simulate (inclusive), e.g. 2023"),
+    initial_bankroll: float = typer.Option(1000.0, help="Initial bankroll amount per season"),
+    workers: int = typer.Option(os.cpu_count() or 1, help="Number of worker processes"),
+) -> None:
+    """Simulate paper trading for a range of seasons in parallel."""
+    # ensure tables exist
+    Base.metadata.create_all(bind=engine)
+    seasons = list(range(start_season, end_season + 1))
+    # Each worker runs simulate_season with its own session; nothing DB-bound is pickled
+    with ProcessPoolExecutor(max_workers=workers, initializer=_reset_engine_pool) as executor:
+        results = list(executor.map(simulate_season, seasons, [initial_bankroll] * len(seasons)))
+
+    n_bets = 0
+    wins = 0.0
+    for season, (final_bankroll, stats) in zip(seasons, results):
+        typer.echo(f"{season}: final bankroll {final_bankroll:.2f}, stats {stats}")
+        n_bets += stats["n_bets"]
+        wins += stats["win_rate"] * stats["n_bets"]
+    mean_roi = sum(stats["roi"] for _, stats in results) / len(results) if results else 0.0
+    typer.echo(
+        f"Total: {n_bets} bets, win rate {wins / n_bets if n_bets else 0.0:.3f}, mean ROI {mean_roi:.3f}"
+    )
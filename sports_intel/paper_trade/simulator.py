@@ -6,88 +6,195 @@ import random
 import logging
 from typing import Tuple, Dict, Union, Optional, List, Any
 
-from sqlalchemy.orm import Session
+import numpy as np
+from sqlalchemy import Integer, and_, bindparam, func, select
+from sqlalchemy.orm import Session, load_only
 
 from sports_intel.db import SessionLocal
 from sports_intel.db.models import Game, Bet, OddsLine
-from sports_intel.betting.kelly import kelly_fraction
+from sports_intel.betting.kelly import kelly_fraction_array
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional (``jit`` extra); run the loop in Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 _logger = logging.getLogger(__name__)
 
-def simulate_season(season: int, initial_bankroll: float = 1000.0) -> Tuple[float, Dict[str, Union[float, int]]]:
+# Canonical (lower-case) market names ingest stores for moneyline odds
+MONEYLINE_MARKETS = ("moneyline",)
+# Games fetched per round-trip while streaming a season
+_GAMES_CHUNK = 1000
+
+
+@njit(cache=True)
+def _run_bankroll(odds, win, fraction, bankroll):
+    """Walk the bets in order, staking *fraction* of the running bankroll.
+
+    Returns the final bankroll plus per-game stake, profit and a mask of the
+    games actually bet (a non-positive stake is skipped).
+    """
+    n = odds.shape[0]
+    stakes = np.zeros(n)
+    profits = np.zeros(n)
+    placed = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        stake = fraction[i] * bankroll
+        if stake <= 0:
+            continue
+        profit = stake * (odds[i] - 1.0) if win[i] else -stake
+        bankroll += profit
+        stakes[i] = stake
+        profits[i] = profit
+        placed[i] = True
+    return bankroll, stakes, profits, placed
+
+
+def warmup() -> None:
+    """Compile (or load from numba's on-disk cache) the bankroll loop ahead of the first season.
+
+    A no-op cost without numba. Long-lived callers such as the dashboard call it
+    once at start-up so the first simulation does not pay the JIT delay.
+    """
+    one = np.ones(1)
+    _run_bankroll(one, np.zeros(1, dtype=np.bool_), np.zeros(1), 1.0)
+
+
+def _latest_moneyline_odds(season):
+    """Subquery ranking each *season* game's moneyline snapshots, newest first (``rn`` = 1).
+
+    *season* may be a plain value or a bind parameter.
+    """
+    return (
+        select(
+            OddsLine.id,
+            OddsLine.game_id,
+            func.row_number()
+            .over(partition_by=OddsLine.game_id, order_by=OddsLine.ts.desc())
+            .label("rn"),
+        )
+        .where(OddsLine.game_id.in_(select(Game.id).where(Game.season == season)))
+        .where(func.lower(OddsLine.market).in_(MONEYLINE_MARKETS))
+        .subquery()
+    )
+
+
+def _season_rows_stmt():
+    """Each settled game of a ``:season`` with the odds, outcome and market of its latest moneyline snapshot.
+
+    Games without both scores or moneyline odds are dropped in SQL.
+    """
+    season = bindparam("season", type_=Integer)
+    latest = _latest_moneyline_odds(season)
+    return (
+        select(Game, OddsLine.odds, OddsLine.outcome, OddsLine.market)
+        .join(latest, and_(latest.c.game_id == Game.id, latest.c.rn == 1))
+        .join(OddsLine, OddsLine.id == latest.c.id)
+        .where(Game.season == season)
+        .where(Game.home_score.isnot(None), Game.away_score.isnot(None))
+        .where(OddsLine.odds.isnot(None))
+        .order_by(Game.date)
+        .options(
+            load_only(
+                Game.id,
+                Game.home_team_id,
+                Game.away_team_id,
+                Game.home_score,
+                Game.away_score,
+            )
+        )
+        .execution_options(yield_per=_GAMES_CHUNK)
+    )
+
+
+# Built once at import; the season is a bound parameter, so every simulation
+# (and every season of a sweep) reuses this statement and its compiled SQL.
+_SEASON_ROWS_STMT = _season_rows_stmt()
+
+
+def simulate_season(
+    season: int,
+    initial_bankroll: float = 1000.0,
+    session: Optional[Session] = None,
+) -> Tuple[float, Dict[str, Union[float, int]]]:
     """
     Run a simple paper‑trade simulation for all games in a season.
 
     For each game, assigns a random win probability, computes Kelly stake,
     simulates outcome, updates bankroll, and records Bet in DB.
 
+    The whole simulation (season read + bet inserts) runs as one transaction.
+    Uses *session* if given (committed, but left open for the caller),
+    otherwise opens and closes its own.
+
     Returns final bankroll and statistics.
     """
-    session: Session = SessionLocal()
-    games = session.query(Game).filter(Game.season == season).order_by(Game.date).all()
+    if session is not None:
+        result = _simulate(session, season, initial_bankroll)
+        session.commit()
+        return result
+    with SessionLocal.begin() as own_session:
+        return _simulate(own_session, season, initial_bankroll)
+
+
+def _simulate(
+    session: Session, season: int, initial_bankroll: float
+) -> Tuple[float, Dict[str, Union[float, int]]]:
+    rows = session.execute(_SEASON_ROWS_STMT, {"season": season})
 
-    if not games:
-        _logger.warning(f"No games found for season {season}")
-        session.close()
+    # Only actionable games come back; keep scalars so streamed Game chunks
+    # can be released, then do the betting math vectorised
+    picks = [
+        (game.id, game.winner_team_id == game.home_team_id, odds, outcome, market)
+        for game, odds, outcome, market in rows
+    ]
+
+    if not picks:
+        _logger.warning(f"No settled games with moneyline odds found for season {season}")
         return initial_bankroll, {"n_bets": 0, "win_rate": 0.0, "roi": 0.0}
 
-    bankroll = initial_bankroll
-    n_bets = 0
-    wins = 0
+    odds_arr = np.array([pick[2] for pick in picks], dtype=float)
+    backs_home = np.array([pick[3].lower().startswith("home") for pick in picks], dtype=bool)
+    home_won = np.array([pick[1] for pick in picks], dtype=bool)
 
-    for game in games:
-        # Skip games without determined winners
-        if game.winner_team_id is None:
-            _logger.info(f"Skipping game {game.id} without winner")
-            continue
+    # naive edge model: assume a 5% edge over the implied probability
+    implied = 1 / odds_arr
+    p_win = implied + 0.05
+    fraction = kelly_fraction_array(p_win, odds_arr)
 
-        # Pull latest odds snapshot (moneyline) for the game
-        odds_row = (
-            session.query(OddsLine)
-            .filter(OddsLine.game_id == game.id)
-            .filter(OddsLine.market.ilike("%moneyline%"))
-            .order_by(OddsLine.ts.desc())
-            .first()
-        )
-        if odds_row is None or odds_row.odds is None:
-            _logger.info(f"No odds found for game {game.id}")
-            continue
+    # Determine actual result
+    win = np.where(backs_home, home_won, ~home_won)
 
-        odds = odds_row.odds
-        # naive edge model: bet if implied prob < 0.5
-        implied = 1 / odds
-        p_win = max(implied + 0.05, implied)  # assume 5% edge
-        fraction = kelly_fraction(p_win, odds)
-        stake = fraction * bankroll
-        if stake <= 0:
-            continue
+    # Stakes depend on the running bankroll: run the recurrence natively
+    bankroll, stakes, profits, placed = _run_bankroll(odds_arr, win, fraction, float(initial_bankroll))
+    picks = [pick for pick, keep in zip(picks, placed) if keep]
+    stakes, profits, win = stakes[placed], profits[placed], win[placed]
 
-        # Determine actual result
-        win = (
-            game.winner_team_id == game.home_team_id
-            if odds_row.outcome.lower().startswith("home")
-            else game.winner_team_id == game.away_team_id
-        )
-        profit = stake * (odds - 1) if win else -stake
-        bankroll += profit
-        n_bets += 1
-        if win:
-            wins += 1
-
-        bet = Bet(
-            ts=dt.datetime.utcnow(),
-            game_id=game.id,
-            market=odds_row.market,
-            selection=odds_row.outcome,
-            stake=stake,
-            odds=odds,
-            mode="paper",
-            profit=profit,  # Store the profit/loss
-        )
-        session.add(bet)
-        session.commit()
+    bankroll = float(bankroll)
+    n_bets = len(picks)
+    wins = int(win.sum())
+    # All bets of one simulation share a single logical timestamp
+    now = dt.datetime.utcnow()
+    bet_rows: List[Dict[str, Any]] = [
+        {
+            "ts": now,
+            "game_id": game_id,
+            "market": market,
+            "selection": outcome,
+            "stake": stake,
+            "odds": odds,
+            "mode": "paper",
+            "profit": profit,  # Store the profit/loss
+        }
+        for (game_id, _, odds, outcome, market), stake, profit in zip(picks, stakes.tolist(), profits.tolist())
+    ]
 
-    session.close()
+    # One executemany for the whole season; the caller commits once
+    if bet_rows:
+        session.bulk_insert_mappings(Bet, bet_rows)
     win_rate = wins / n_bets if n_bets > 0 else 0.0
     roi = (bankroll - initial_bankroll) / initial_bankroll
     stats: Dict[str, Union[float, int]] = {
@@ -15,31 +15,51 @@ from __future__ import annotations
 
 import datetime as dt
 import logging
+import os
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Tuple
 
 import pandas as pd
 import streamlit as st
-from sqlalchemy import select, func
+from sqlalchemy import Date, DateTime, bindparam, func, select
 from sqlalchemy.orm import aliased
+from sqlalchemy.schema import CreateIndex
 
-# Local package imports
+try:  # optional: Arrow-based loader (``pip install connectorx``)
+    import connectorx as cx
+except ImportError:  # pragma: no cover - fall back to the DB-API path
+    cx = None
+
+# Local package imports (providers and the simulator are imported where used;
+# the simulator/numba warm-up runs on a background thread, see _warm_up_simulator)
 from sports_intel.db import Base, SessionLocal, engine
 from sports_intel.db.models import Bet, Game, OddsLine, Team, Player
-from sports_intel.ingest.dk_odds import DraftKingsNBAOddsProvider
-from sports_intel.ingest.nba_stats import NBAStatsProvider
-from sports_intel.ingest.sportsdb_provider import TheSportsDBProvider
-from sports_intel.paper_trade.simulator import simulate_season
 
 _logger = logging.getLogger(__name__)
 
+# DraftKings event URLs: .../event/<slug>/<event id>
+_EVENT_ID_RE = re.compile(r"/event/.*?/(\d+)")
+# How often the ingest status fragment polls background jobs
+_INGEST_POLL_SECONDS = 1.0
+
 # ---------------------------------------------------------------------------
 # Helper functions (DB access & provider wrappers)
 # ---------------------------------------------------------------------------
 
 def init_db() -> None:
-    """Create all tables if they do not already exist."""
+    """Create all tables and indexes if they do not already exist.
+
+    ``create_all`` only emits indexes alongside tables it creates, so indexes
+    added to the models later are created here for existing databases too.
+    """
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                conn.execute(CreateIndex(index, if_not_exists=True))
 
 
 def drop_db() -> None:
@@ -52,18 +72,24 @@ def ingest_nba_stats(season: int) -> None:
 
     Note: This method is kept for backward compatibility but TheSportsDB is preferred.
     """
+    from sports_intel.ingest.nba_stats import NBAStatsProvider
+
     provider = NBAStatsProvider(season)
     provider.backfill()
 
 
 def ingest_dk_odds(season: int) -> None:
     """Backfill DraftKings odds for *season*. Requires that games already exist."""
+    from sports_intel.ingest.dk_odds import DraftKingsNBAOddsProvider
+
     provider = DraftKingsNBAOddsProvider(season)
     provider.backfill()
 
 
 def ingest_sportsdb(season: int, update_only: bool = False, date_range: Tuple[dt.date, dt.date] = None) -> None:
     """Ingest data from TheSportsDB API for NBA games, teams, and players."""
+    from sports_intel.ingest.sportsdb_provider import TheSportsDBProvider
+
     provider = TheSportsDBProvider(season)
     if update_only:
         if date_range:
@@ -76,60 +102,249 @@ def ingest_sportsdb(season: int, update_only: bool = False, date_range: Tuple[dt
 
 def fetch_specific_game(game_id: str) -> None:
     """Fetch detailed data for a specific game."""
+    from sports_intel.ingest.sportsdb_provider import TheSportsDBProvider
+
     provider = TheSportsDBProvider()
     provider.fetch_game_details(game_id)
 
 
 def fetch_team_roster(team_id: int) -> None:
     """Fetch detailed roster data for a specific team."""
+    from sports_intel.ingest.sportsdb_provider import TheSportsDBProvider
+
     provider = TheSportsDBProvider()
     provider.fetch_team_roster(team_id)
 
 
 def fetch_player_stats(player_id: int) -> None:
     """Fetch historical stats for a specific player."""
+    from sports_intel.ingest.sportsdb_provider import TheSportsDBProvider
+
     provider = TheSportsDBProvider()
     provider.fetch_player_stats(player_id)
 
 
-def fetch_event_details(event_url: str, season: int) -> None:
-    """Fetch detailed odds for a specific event URL."""
+def ingest_event_details(event_url: str, season: int) -> int:
+    """Fetch and store detailed odds for a DraftKings event URL; return the row count.
+
+    Raises ``ValueError`` for an unrecognised URL or an event without odds.
+    Does not touch Streamlit, so it can run on a background thread.
+    """
     # Extract event ID from URL if possible
-    import re
-    event_id_match = re.search(r"/event/.*?/(\d+)", event_url)
+    event_id_match = _EVENT_ID_RE.search(event_url)
     if not event_id_match:
-        st.error("Could not extract event ID from URL")
-        return
+        raise ValueError("Could not extract event ID from URL")
+
+    from sports_intel.ingest.dk_odds import DraftKingsNBAOddsProvider
 
     event_id = int(event_id_match.group(1))
     provider = DraftKingsNBAOddsProvider(season)
+    event_df = provider._fetch_event_details(event_id)
+    if event_df.empty:
+        raise ValueError(f"No odds data found for event ID {event_id}")
 
+    # Store the data
+    provider._persist(event_df)
+    return len(event_df)
+
+
+def fetch_event_details(event_url: str, season: int) -> None:
+    """Fetch detailed odds for a specific event URL."""
     try:
-        event_df = provider._fetch_event_details(event_id)
-        if event_df.empty:
-            st.error(f"No odds data found for event ID {event_id}")
-            return
-
-        # Store the data
-        provider._persist(event_df)
-        st.success(f"Successfully fetched and stored {len(event_df)} odds lines for event ID {event_id}")
+        n_lines = ingest_event_details(event_url, season)
+        st.success(f"Successfully fetched and stored {n_lines} odds lines for event ID {_EVENT_ID_RE.search(event_url).group(1)}")
+    except ValueError as e:
+        st.error(str(e))
     except Exception as e:
         st.error(f"Error fetching event details: {e}")
 
 
-def load_table_df(model, season: int | None = None) -> pd.DataFrame:
-    """Return a DataFrame for *model* limited to *season* if provided."""
-    session = SessionLocal()
-    try:
-        query = select(model)
-        if season is not None and hasattr(model, "season"):
-            query = query.where(model.season == season)  # type: ignore[attr-defined]
-        df = pd.read_sql(query, session.bind)
-    finally:
-        session.close()
+def _ingest_jobs() -> dict[str, Future]:
+    """Background ingest futures of this browser session, keyed by source label."""
+    return st.session_state.setdefault("ingest_jobs", {})
+
+
+def submit_ingest(label: str, fn, *args) -> None:
+    """Run ``fn(*args)`` on the session's ingest thread pool (one job per *label*)."""
+    jobs = _ingest_jobs()
+    if label in jobs:
+        st.info(f"{label} is already running.")
+        return
+    if "ingest_executor" not in st.session_state:
+        st.session_state["ingest_executor"] = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="ingest"
+        )
+    jobs[label] = st.session_state["ingest_executor"].submit(fn, *args)
+
+
+def render_ingest_jobs() -> None:
+    """Report ingests that finished since the last run, then poll any still running."""
+    for label, error in st.session_state.pop("ingest_results", []):
+        if error is not None:
+            st.error(f"Failed to fetch from {label}: {error}")
+            if label == "NBA Stats (Legacy)":
+                st.info("We recommend using TheSportsDB instead for more reliable data")
+        else:
+            st.success(f"Successfully fetched data from {label}")
+    if _ingest_jobs():
+        _poll_ingest_jobs()
+
+
+@st.fragment(run_every=_INGEST_POLL_SECONDS)
+def _poll_ingest_jobs() -> None:
+    """Status of running ingests, refreshed on its own timer without rerunning the app.
+
+    Only rendered while jobs exist, so the timer stops with the last one. When
+    a job finishes its outcome is queued for ``render_ingest_jobs`` and the
+    whole app reruns once, so every tab picks up the new data.
+    """
+    jobs = _ingest_jobs()
+    finished = []
+    for label, future in list(jobs.items()):
+        if not future.done():
+            st.status(f"Fetching from {label} …", state="running")
+            continue
+        del jobs[label]
+        finished.append((label, future.exception()))
+    if not finished:
+        return
+    executor = st.session_state.get("ingest_executor")
+    if not jobs and executor is not None:
+        # Idle: release the worker threads; submit_ingest starts a new pool
+        executor.shutdown(wait=False)
+        del st.session_state["ingest_executor"]
+    st.session_state.setdefault("ingest_results", []).extend(finished)
+    clear_cached_queries()
+    st.rerun()
+
+
+# Models addressable by name, so cached loaders can key on a hashable string
+_MODELS = {model.__name__: model for model in (Bet, Game, OddsLine, Team, Player)}
+
+# Cache lifetimes (seconds): odds/games/bets change with every ingest, teams rarely
+_TTL_SHORT = 300
+_TTL_LONG = 3600
+# Rows per cursor.fetchmany() when streaming query results into pandas
+_FETCH_BATCH = 10_000
+# Low-cardinality text columns loaded as pandas categoricals
+_CATEGORY_COLUMNS = ("market", "sportsbook")
+
+
+def _read_sql_fast(stmt, bind=engine, params: dict[str, Any] | None = None) -> pd.DataFrame:
+    """Run *stmt* and build the DataFrame from the plain tuples of its DB-API cursor.
+
+    Executing through the connection keeps SQLAlchemy's compiled cache and
+    bind handling; reading ``result.cursor`` directly skips the per-row Row
+    objects / result processors. Only the Date/DateTime columns are converted
+    afterwards, in one vectorised pass. Rows are fetched in batches of
+    ``_FETCH_BATCH`` and each batch is turned into a frame straight away, so
+    the full list of tuples never sits in memory next to the finished
+    DataFrame. *params* fill ``bindparam``s.
+    """
+    with bind.connect() as conn:
+        result = conn.execute(stmt, params or {})
+        cursor = result.cursor
+        columns = [c[0] for c in cursor.description]
+        frames = []
+        while batch := cursor.fetchmany(_FETCH_BATCH):
+            frames.append(pd.DataFrame(batch, columns=columns))
+        result.close()
+    if not frames:
+        df = pd.DataFrame(columns=columns)
+    elif len(frames) == 1:
+        df = frames[0]
+    else:
+        df = pd.concat(frames, ignore_index=True)
+    return _shrink(_coerce_temporal(df, stmt))
+
+
+def _read_sql_arrow(stmt, bind=engine, params: dict[str, Any] | None = None) -> pd.DataFrame:
+    """Load *stmt* through connectorx's Arrow transport when it is installed.
+
+    Parameterised statements and installs without connectorx use ``_read_sql_fast``.
+    """
+    if cx is None or params:
+        return _read_sql_fast(stmt, bind, params)
+    sql = str(stmt.compile(bind, compile_kwargs={"literal_binds": True}))
+    url = bind.url
+    if url.get_backend_name() == "sqlite":
+        conn = f"sqlite://{os.path.abspath(url.database)}"
+    else:
+        conn = url.render_as_string(hide_password=False)
+    df = cx.read_sql(conn, sql, return_type="pandas")
+    return _shrink(_coerce_temporal(df, stmt))
+
+
+def _coerce_temporal(df: pd.DataFrame, stmt) -> pd.DataFrame:
+    """Convert the Date/DateTime columns of *stmt* in one vectorised pass each."""
+    for column in stmt.selected_columns:
+        name = column.key
+        if name not in df.columns:
+            continue
+        if isinstance(column.type, DateTime):
+            df[name] = pd.to_datetime(df[name])
+        elif isinstance(column.type, Date):
+            df[name] = pd.to_datetime(df[name]).dt.date
     return df
 
 
+def _shrink(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast numeric columns and categorise low-cardinality labels.
+
+    Smaller frames are cheaper to cache and to serialise to Arrow for
+    ``st.dataframe``.
+    """
+    for col in df.select_dtypes("int64").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    for col in df.select_dtypes("float64").columns:
+        df[col] = pd.to_numeric(df[col], downcast="float")
+    for col in _CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def clear_cached_queries() -> None:
+    """Drop every cached query result (call after ingesting new data)."""
+    st.cache_data.clear()
+    st.session_state.pop("teams_df", None)
+
+
+def load_table_df(
+    model, season: int | None = None, filters: dict[str, Any] | None = None
+) -> pd.DataFrame:
+    """Return a DataFrame for *model* limited to *season* if provided.
+
+    *filters* maps column names to required values and is applied in SQL;
+    ``None`` or ``"All"`` values are ignored.
+    """
+    active = tuple(
+        sorted((col, val) for col, val in (filters or {}).items() if val not in (None, "All"))
+    )
+    return _load_table_df_cached(model.__name__, season, active)
+
+
+@st.cache_data(ttl=_TTL_SHORT, show_spinner=False)
+def _load_table_df_cached(
+    model_name: str, season: int | None, filters: tuple[tuple[str, Any], ...] = ()
+) -> pd.DataFrame:
+    model = _MODELS[model_name]
+    query = select(model)
+    if season is not None and hasattr(model, "season"):
+        query = query.where(model.season == season)  # type: ignore[attr-defined]
+    for col, val in filters:
+        query = query.where(getattr(model, col) == val)
+    return _read_sql_arrow(query)
+
+
+@st.cache_data(ttl=_TTL_SHORT, show_spinner=False)
+def _distinct_values(model_name: str, column: str) -> list:
+    """Sorted distinct non-null values of *column* (feeds filter dropdowns)."""
+    col = getattr(_MODELS[model_name], column)
+    with engine.connect() as conn:
+        return list(conn.execute(select(col).where(col.is_not(None)).distinct().order_by(col)).scalars())
+
+
 def get_available_seasons() -> list[int]:
     """Return a list of seasons available for NBA data."""
     current_year = dt.datetime.utcnow().year
@@ -137,74 +352,538 @@ def get_available_seasons() -> list[int]:
     return list(range(current_year, current_year - 6, -1))
 
 
-def get_upcoming_games(days: int = 15) -> pd.DataFrame:
-    """Get upcoming NBA games from database for the next *days*."""
-    session = SessionLocal()
-    try:
-        today = dt.date.today()
-        future = today + dt.timedelta(days=days)
-
-        # Use explicit table aliases
-        HomeTeam = aliased(Team)
-        AwayTeam = aliased(Team)
-
-        # Build query with aliases
-        query = (
-            select(
-                Game.id,
-                Game.ext_game_id,
-                Game.season,
-                Game.date,
-                Game.home_team_id,
-                Game.away_team_id,
-                Game.venue,
-                Game.home_score,
-                Game.away_score,
-                HomeTeam.name.label('home_team_name'),
-                HomeTeam.alias.label('home_team_alias'),
-                AwayTeam.name.label('away_team_name'),
-                AwayTeam.alias.label('away_team_alias')
-            )
-            .join(HomeTeam, HomeTeam.id == Game.home_team_id)
-            .join(AwayTeam, AwayTeam.id == Game.away_team_id)
-            .where(Game.date >= today)
-            .where(Game.date <= future)
-            .order_by(Game.date)
+# Home/away team aliases for games queries; "Away @ Home" is built in SQL
+_HomeTeam = aliased(Team, name="home_team")
+_AwayTeam = aliased(Team, name="away_team")
+_MATCHUP = (_AwayTeam.name + " @ " + _HomeTeam.name).label('matchup')
+
+
+def _games_base_select(*columns):
+    """Games with home/away team names joined in, shared by every Games tab filter.
+
+    Selects *columns* when given (they may reference ``_HomeTeam``/``_AwayTeam``),
+    otherwise the full game row plus team names and the matchup string.
+    """
+    if not columns:
+        columns = (
+            Game.id,
+            Game.ext_game_id,
+            Game.season,
+            Game.date,
+            Game.home_team_id,
+            Game.away_team_id,
+            Game.venue,
+            Game.home_score,
+            Game.away_score,
+            _HomeTeam.name.label('home_team_name'),
+            _HomeTeam.alias.label('home_team_alias'),
+            _AwayTeam.name.label('away_team_name'),
+            _AwayTeam.alias.label('away_team_alias'),
+            _MATCHUP,
         )
+    return (
+        select(*columns)
+        .select_from(Game)
+        .join(_HomeTeam, _HomeTeam.id == Game.home_team_id, isouter=True)
+        .join(_AwayTeam, _AwayTeam.id == Game.away_team_id, isouter=True)
+    )
 
-        df = pd.read_sql(query, session.bind)
-    except Exception as e:
-        st.error(f"Error fetching upcoming games: {e}")
-        df = pd.DataFrame()
-    finally:
-        session.close()
-    return df
+
+# Games-tab statements; dates are bound per call (lo/hi), so every window
+# shares one entry in the engine's compiled cache
+_DATE_BETWEEN = Game.date.between(bindparam("lo", type_=Date), bindparam("hi", type_=Date))
+_UPCOMING_STMT = (
+    _games_base_select(Game.id, Game.date, _MATCHUP).where(_DATE_BETWEEN).order_by(Game.date)
+)
+_RECENT_STMT = _games_base_select().where(_DATE_BETWEEN).order_by(Game.date.desc())
+_DATE_RANGE_STMT = _games_base_select().where(_DATE_BETWEEN).order_by(Game.date)
+
+
+@st.cache_data(ttl=_TTL_SHORT, show_spinner=False)
+def load_games_df(season: int | None = None) -> pd.DataFrame:
+    """All games (with team names) limited to *season* if provided."""
+    query = _games_base_select().order_by(Game.date)
+    if season is not None:
+        query = query.where(Game.season == season)
+    return _read_sql_arrow(query)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_table_counts() -> Tuple[int, int, int, int, int]:
+    """Row counts for games, teams, players, odds lines and bets in one round trip."""
+    query = select(
+        *(
+            select(func.count()).select_from(model).scalar_subquery()
+            for model in (Game, Team, Player, OddsLine, Bet)
+        )
+    )
+    with engine.connect() as conn:
+        return tuple(conn.execute(query).one())
+
+
+@st.cache_data(ttl=_TTL_SHORT, show_spinner=False)
+def get_upcoming_games(days: int = 15) -> pd.DataFrame:
+    """Get upcoming NBA games from database for the next *days*.
+
+    Errors propagate (and so are not cached); the caller reports them.
+    """
+    today = dt.date.today()
+    future = today + dt.timedelta(days=days)
+    return _read_sql_arrow(_UPCOMING_STMT, params={"lo": today, "hi": future})
 
 
+@st.cache_data(ttl=_TTL_LONG, show_spinner=False)
 def get_teams() -> pd.DataFrame:
     """Get all teams from database."""
     return load_table_df(Team)
 
 
+def _teams_df() -> pd.DataFrame:
+    """Teams frame kept in the browser session, so reruns skip even the cache lookup."""
+    if "teams_df" not in st.session_state:
+        st.session_state["teams_df"] = get_teams()
+    return st.session_state["teams_df"]
+
+
+@st.cache_data(ttl=_TTL_LONG, show_spinner=False)
 def get_players(team_id: int = None) -> pd.DataFrame:
     """Get players from database, filtered by team_id if provided."""
-    session = SessionLocal()
-    try:
-        query = select(Player)
-        if team_id is not None:
-            query = query.where(Player.team_id == team_id)
-        df = pd.read_sql(query, session.bind)
-    finally:
-        session.close()
-    return df
+    query = select(Player)
+    if team_id is not None:
+        query = query.where(Player.team_id == team_id)
+    return _read_sql_arrow(query)
+
+
+@st.cache_data(ttl=_TTL_LONG, show_spinner=False)
+def get_players_by_team_names(names: Tuple[str, ...]) -> pd.DataFrame:
+    """Get players whose team name is one of *names* (joined in SQL)."""
+    query = select(Player).join(Team, Team.id == Player.team_id).where(Team.name.in_(names))
+    return _read_sql_arrow(query)
 
 
 # ---------------------------------------------------------------------------
 # Streamlit UI
 # ---------------------------------------------------------------------------
 
+def _warm_up_simulator_worker() -> None:
+    try:
+        from sports_intel.paper_trade.simulator import warmup
+
+        warmup()
+    except Exception:  # only an optimisation; the first simulation compiles instead
+        _logger.exception("Simulator warm-up failed")
+
+
+@st.cache_resource(show_spinner=False)
+def _warm_up_simulator() -> threading.Thread:
+    """Import and JIT-compile the simulator once per server process, off the render path.
+
+    Runs on a daemon thread so the first page renders without waiting for
+    numba; by the first "Run Simulation" click the loop is usually compiled.
+    """
+    thread = threading.Thread(target=_warm_up_simulator_worker, name="simulator-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+# Tab bodies: the read-only tabs are fragments, so their widgets rerun only
+# their own tab; ingestion and simulation write data the other tabs show, so
+# they keep full-script reruns. Ingest jobs are polled by the timed
+# _poll_ingest_jobs fragment.
+
+
+def _ingestion_tab(season: int) -> None:
+    """Data Ingestion tab: TheSportsDB fetches and background ingests of other sources."""
+    st.header("Data Ingestion Options")
+
+    fetch_col1, fetch_col2 = st.columns(2)
+
+    with fetch_col1:
+        st.subheader("TheSportsDB Data")
+        data_source = st.selectbox(
+            "Data Source",
+            options=["TheSportsDB", "NBA Stats", "DraftKings Odds", "DraftKings Game Detail"],
+            index=0
+        )
+
+        update_only = False
+        if data_source == "TheSportsDB":
+            update_only = st.checkbox("Update mode (recent/upcoming data only)", value=False)
+
+        if data_source == "DraftKings Game Detail":
+            event_url = st.text_input(
+                "DraftKings event URL",
+                placeholder="https://sportsbook.draftkings.com/event/team-vs-team/12345678"
+            )
+
+        if data_source == "TheSportsDB":
+            data_mode = st.radio(
+                "Fetching Mode:",
+                options=["Upcoming Games", "Date Range", "Season Backfill"],
+                index=0,
+            )
+
+            if data_mode == "Upcoming Games":
+                days_ahead = st.slider("Days to fetch ahead", min_value=1, max_value=30, value=15)
+                if st.button("Fetch Upcoming Games"):
+                    with st.spinner(f"Fetching NBA data for next {days_ahead} days..."):
+                        try:
+                            from sports_intel.ingest.sportsdb_provider import TheSportsDBProvider
+
+                            provider = TheSportsDBProvider(season)
+                            provider.update(days_ahead=days_ahead)
+                            clear_cached_queries()
+                            st.success(f"Successfully fetched upcoming games for the next {days_ahead} days")
+                        except Exception as e:
+                            st.error(f"Failed to fetch upcoming games: {str(e)}")
+
+            elif data_mode == "Date Range":
+                col1, col2 = st.columns(2)
+                with col1:
+                    start_date = st.date_input("Start Date", value=dt.date.today() - dt.timedelta(days=7))
+                with col2:
+                    end_date = st.date_input("End Date", value=dt.date.today() + dt.timedelta(days=7))
+
+                if st.button("Fetch Games in Date Range"):
+                    if start_date <= end_date:
+                        with st.spinner(f"Fetching NBA data from {start_date} to {end_date}..."):
+                            try:
+                                ingest_sportsdb(season, update_only=True, date_range=(start_date, end_date))
+                                clear_cached_queries()
+                                st.success(f"Successfully fetched games from {start_date} to {end_date}")
+                            except Exception as e:
+                                st.error(f"Failed to fetch games in date range: {str(e)}")
+                    else:
+                        st.error("End date must be after start date")
+
+            else:  # Season Backfill
+                st.warning(f"This will attempt to fetch all games for the {season}-{season+1} season. This may not work for future seasons.")
+                if st.button("Backfill Season Data"):
+                    with st.spinner(f"Fetching full season data for {season}-{season+1}..."):
+                        try:
+                            ingest_sportsdb(season, update_only=False)
+                            clear_cached_queries()
+                            st.success(f"Successfully fetched data for {season}-{season+1} season")
+                        except Exception as e:
+                            st.error(f"Failed to backfill season data: {str(e)}")
+
+    with fetch_col2:
+        st.subheader("Other Data Sources")
+        other_source = st.selectbox(
+            "Source:",
+            options=["DraftKings Odds", "NBA Stats (Legacy)", "DraftKings Game Detail"],
+        )
+
+        if other_source == "DraftKings Game Detail":
+            event_url = st.text_input(
+                "DraftKings event URL",
+                placeholder="https://sportsbook.draftkings.com/event/team-vs-team/12345678"
+            )
+
+        # Runs in the background so the other tabs stay usable meanwhile
+        if st.button(f"Fetch from {other_source}"):
+            if other_source == "DraftKings Odds":
+                submit_ingest(other_source, ingest_dk_odds, season)
+            elif other_source == "NBA Stats (Legacy)":
+                submit_ingest(other_source, ingest_nba_stats, season)
+            elif other_source == "DraftKings Game Detail":
+                if not event_url:
+                    st.error("Please enter a DraftKings event URL")
+                else:
+                    submit_ingest(other_source, ingest_event_details, event_url, season)
+        render_ingest_jobs()
+
+
+@st.fragment
+def _games_tab(season: int) -> None:
+    """Games tab: upcoming / recent / date-range / season game listings."""
+    st.header("NBA Games")
+
+    # Games filtering options
+    filter_col1, filter_col2, filter_col3 = st.columns(3)
+    with filter_col1:
+        filter_option = st.radio("Filter by:", ["Upcoming", "Recent", "All", "Date Range"])
+
+    if filter_option == "Upcoming":
+        try:
+            games_df = get_upcoming_games(days=15)
+        except Exception as e:
+            st.error(f"Error fetching upcoming games: {e}")
+            games_df = pd.DataFrame()
+    elif filter_option == "Recent":
+        today = dt.date.today()
+        past_date = today - dt.timedelta(days=7)
+        games_df = _read_sql_arrow(_RECENT_STMT, params={"lo": past_date, "hi": today})
+    elif filter_option == "Date Range":
+        with filter_col2:
+            start_date = st.date_input("Start Date", value=dt.date.today() - dt.timedelta(days=7))
+        with filter_col3:
+            end_date = st.date_input("End Date", value=dt.date.today() + dt.timedelta(days=7))
+
+        games_df = _read_sql_arrow(_DATE_RANGE_STMT, params={"lo": start_date, "hi": end_date})
+    else:  # All
+        games_df = load_games_df(season)
+
+    # Display games
+    if not games_df.empty:
+        # Display the games
+        st.dataframe(games_df)
+
+        # Game selection for detailed view
+        if 'id' in games_df.columns:
+            # id -> label once, so format_func is a dict lookup per option
+            game_labels = {
+                game_id: f"{matchup} ({date})"
+                for game_id, matchup, date in zip(games_df['id'].tolist(), games_df['matchup'], games_df['date'])
+            }
+            selected_game_id = st.selectbox(
+                "Select a game for detailed view:",
+                options=list(game_labels),
+                format_func=game_labels.__getitem__
+            )
+
+            if st.button("Fetch Detailed Game Data"):
+                with st.spinner("Fetching detailed game data..."):
+                    # Here you'd implement logic to get detailed game info from the API
+                    st.info("Detailed game data fetching is not yet implemented")
+                    # Future implementation: fetch_specific_game(selected_game_id)
+    else:
+        st.info("No games found; ingest data first.")
+
+
+@st.fragment
+def _teams_tab() -> None:
+    """Teams tab: team list and per-team roster."""
+    st.header("NBA Teams")
+
+    teams_df = _teams_df()
+    if not teams_df.empty:
+        st.dataframe(teams_df)
+
+        team_names = dict(zip(teams_df['id'].tolist(), teams_df['name']))
+        selected_team_id = st.selectbox(
+            "Select a team to view roster:",
+            options=list(team_names),
+            format_func=team_names.__getitem__
+        )
+
+        if st.button("Fetch Team Roster"):
+            with st.spinner(f"Fetching roster for {team_names[selected_team_id]}..."):
+                players_df = get_players(selected_team_id)
+                if not players_df.empty:
+                    st.subheader(f"Roster - {team_names[selected_team_id]}")
+                    st.dataframe(players_df)
+                else:
+                    st.info(f"No players found for this team. Try fetching roster data first.")
+
+                    if st.button("Fetch Players from TheSportsDB"):
+                        with st.spinner("Fetching player data..."):
+                            try:
+                                fetch_team_roster(selected_team_id)
+                                clear_cached_queries()
+                                st.success("Successfully fetched team roster")
+                                # Refresh the view
+                                players_df = get_players(selected_team_id)
+                                if not players_df.empty:
+                                    st.dataframe(players_df)
+                            except Exception as e:
+                                st.error(f"Failed to fetch team roster: {str(e)}")
+    else:
+        st.info("No teams found; ingest data first.")
+
+
+@st.fragment
+def _players_tab() -> None:
+    """Players tab: all players, optionally filtered by team."""
+    st.header("NBA Players")
+
+    players_df = get_players()
+    if not players_df.empty:
+        # Add filtering options
+        filter_options = st.multiselect(
+            "Filter by team:",
+            options=_distinct_values("Team", "name")
+        )
+
+        if filter_options:
+            filtered_players = get_players_by_team_names(tuple(filter_options))
+            st.dataframe(filtered_players)
+
+            if not filtered_players.empty:
+                player_names = dict(zip(filtered_players['id'].tolist(), filtered_players['name']))
+                selected_player_id = st.selectbox(
+                    "Select a player for detailed stats:",
+                    options=list(player_names),
+                    format_func=player_names.__getitem__
+                )
+
+                if st.button("Fetch Player Stats"):
+                    with st.spinner("Fetching player statistics..."):
+                        # Here you would implement the player stats fetching
+                        st.info("Player statistics fetching is not yet implemented")
+                        # Future implementation: fetch_player_stats(selected_player_id)
+        else:
+            st.dataframe(players_df)
+    else:
+        st.info("No players found; ingest team rosters first.")
+
+
+@st.fragment
+def _odds_tab(season: int) -> None:
+    """Odds tab: filtered odds lines and DraftKings event-detail fetches."""
+    st.header("Betting Odds")
+
+    markets = _distinct_values("OddsLine", "market")
+    if markets:
+        # Add filtering options
+        filter_col1, filter_col2 = st.columns(2)
+
+        with filter_col1:
+            market_filter = st.selectbox(
+                "Filter by market type:",
+                options=["All"] + markets,
+            )
+
+        with filter_col2:
+            sportsbook_filter = st.selectbox(
+                "Filter by sportsbook:",
+                options=["All"] + _distinct_values("OddsLine", "sportsbook"),
+            )
+
+        # Filters are applied in SQL, so only matching rows are loaded
+        filtered_df = load_table_df(
+            OddsLine, season, filters={"market": market_filter, "sportsbook": sportsbook_filter}
+        )
+
+        # Display filtered data
+        st.dataframe(filtered_df)
+
+        # Add a section for fetching detailed odds from DraftKings
+        st.subheader("Fetch Detailed Odds from DraftKings")
+        st.info("Enter a DraftKings event URL to fetch detailed odds including player props and more.")
+
+        dk_url = st.text_input(
+            "DraftKings event URL",
+            placeholder="https://sportsbook.draftkings.com/event/team-vs-team/12345678"
+        )
+
+        if st.button("Fetch Detailed Odds"):
+            if not dk_url:
+                st.error("Please enter a valid DraftKings event URL")
+            else:
+                with st.spinner("Fetching detailed odds from DraftKings..."):
+                    try:
+                        fetch_event_details(dk_url, season)
+                        clear_cached_queries()
+                        # Refresh the odds dataframe after fetching
+                        fresh_odds = load_table_df(OddsLine, season)
+                        st.success("Detailed odds data fetched successfully!")
+                        st.info("Refresh the page to see all new market types in the filter dropdown.")
+                    except Exception as e:
+                        st.error(f"Failed to fetch detailed odds: {str(e)}")
+
+        # Display events with existing detailed odds
+        if 'event_id' in filtered_df.columns:
+            unique_events = filtered_df.groupby('event_id')['market'].nunique().reset_index()
+            unique_events = unique_events.sort_values('market', ascending=False)
+
+            if not unique_events.empty:
+                st.subheader("Events with Most Market Types")
+                top_events = unique_events.head(5)
+                event_rows = filtered_df[filtered_df['event_id'].isin(top_events['event_id'])]
+                markets_by_event = event_rows.groupby('event_id')['market'].unique()
+                game_by_event = event_rows.groupby('event_id')['game_id'].first()
+
+                # One query for every listed event's home/away team names
+                game_ids = [int(g) for g in game_by_event.dropna().unique() if g]
+                matchups = {}
+                if game_ids:
+                    HomeTeam = aliased(Team)
+                    AwayTeam = aliased(Team)
+                    with SessionLocal() as session:
+                        rows = session.execute(
+                            select(Game.id, HomeTeam.name.label("home"), AwayTeam.name.label("away"))
+                            .join(HomeTeam, HomeTeam.id == Game.home_team_id)
+                            .join(AwayTeam, AwayTeam.id == Game.away_team_id, isouter=True)
+                            .where(Game.id.in_(game_ids))
+                        ).all()
+                    matchups = {game_id: (home, away) for game_id, home, away in rows}
+
+                for event_id, market_count in zip(top_events['event_id'], top_events['market']):
+                    game_id = game_by_event.get(event_id)
+                    if game_id in matchups:
+                        home, away = matchups[game_id]
+                        teams_display = f"{away} @ {home}"
+                        st.markdown(f"**Event ID {event_id}**: {teams_display} ({market_count} markets)")
+
+                        # Show a sample of markets
+                        with st.expander(f"Sample of markets for {teams_display}"):
+                            st.write(sorted(markets_by_event[event_id])[:10])
+    else:
+        st.info("No odds data found; ingest DraftKings odds first.")
+
+
+@st.fragment
+def _bets_tab(season: int) -> None:
+    """Bets tab: paper-trade bets of the selected season."""
+    st.header("Bets")
+
+    bets_df = load_table_df(Bet, season)
+    if not bets_df.empty:
+        st.dataframe(bets_df)
+    else:
+        st.info("No bets found; run a simulation first.")
+
+
+def _simulation_tab(season: int, bankroll: float) -> None:
+    """Simulation tab: run a paper-trade season and show table counts."""
+    st.header("Simulation")
+
+    st.subheader("Configure Simulation")
+    sim_bankroll = st.number_input(
+        "Simulation Bankroll (USD)",
+        min_value=100.0,
+        value=bankroll,
+        step=100.0,
+        format="%.2f",
+    )
+
+    if st.button("Run Simulation"):
+        from sports_intel.paper_trade.simulator import simulate_season
+
+        with st.spinner("Running paper‑trade simulation …"):
+            final_bankroll, stats = simulate_season(int(season), float(sim_bankroll))
+        clear_cached_queries()
+        st.session_state["last_sim"] = {
+            "final_bankroll": final_bankroll,
+            "stats": stats,
+        }
+        st.success("Simulation complete.")
+
+    st.subheader("Simulation Results")
+    if "last_sim" in st.session_state:
+        sim = st.session_state["last_sim"]
+        st.metric("Final Bankroll", f"$ {sim['final_bankroll']:.2f}")
+        st.json(sim["stats"], expanded=False)
+    else:
+        st.info("Run a simulation to see results.")
+
+    # Quick counts summary
+    game_count, team_count, player_count, odds_count, bet_count = get_table_counts()
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("🏀 Teams", f"{team_count}")
+    col2.metric("👤 Players", f"{player_count}")
+    col3.metric("🎮 Games", f"{game_count}")
+
+    col1, col2 = st.columns(2)
+    col1.metric("📈 Odds Lines", f"{odds_count}")
+    col2.metric("💵 Bets", f"{bet_count}")
+
+
 def main() -> None:
     st.set_page_config(page_title="Sports‑Intel Dashboard", layout="wide")
+    _warm_up_simulator()
 
     st.title("🏀 Sports‑Intel Dashboard")
     st.markdown(
@@ -232,15 +911,21 @@ def main() -> None:
         )
 
         st.divider()
+        if st.button("Refresh cache"):
+            clear_cached_queries()
+            st.success("Cached query results cleared.")
+
         if st.button("Initialize DB"):
             with st.spinner("Creating tables …"):
                 init_db()
+            clear_cached_queries()
             st.success("Database tables ensured.")
 
         if st.button("Drop DB (danger)"):
             if st.confirm("Really drop ALL tables? This deletes data irreversibly."):
                 with st.spinner("Dropping tables …"):
                     drop_db()
+                clear_cached_queries()
                 st.success("All tables dropped.")
 
     # ---------------------------------------------------------------------
@@ -250,438 +935,31 @@ def main() -> None:
 
     # Data Ingestion tab ------------------------------------------------------------
     with tabs[0]:
-        st.header("Data Ingestion Options")
-
-        fetch_col1, fetch_col2 = st.columns(2)
-
-        with fetch_col1:
-            st.subheader("TheSportsDB Data")
-            data_source = st.selectbox(
-                "Data Source",
-                options=["TheSportsDB", "NBA Stats", "DraftKings Odds", "DraftKings Game Detail"],
-                index=0
-            )
-
-            update_only = False
-            if data_source == "TheSportsDB":
-                update_only = st.checkbox("Update mode (recent/upcoming data only)", value=False)
-
-            if data_source == "DraftKings Game Detail":
-                event_url = st.text_input(
-                    "DraftKings event URL",
-                    placeholder="https://sportsbook.draftkings.com/event/team-vs-team/12345678"
-                )
-
-            if data_source == "TheSportsDB":
-                data_mode = st.radio(
-                    "Fetching Mode:",
-                    options=["Upcoming Games", "Date Range", "Season Backfill"],
-                    index=0,
-                )
-
-                if data_mode == "Upcoming Games":
-                    days_ahead = st.slider("Days to fetch ahead", min_value=1, max_value=30, value=15)
-                    if st.button("Fetch Upcoming Games"):
-                        with st.spinner(f"Fetching NBA data for next {days_ahead} days..."):
-                            try:
-                                provider = TheSportsDBProvider(season)
-                                provider.update(days_ahead=days_ahead)
-                                st.success(f"Successfully fetched upcoming games for the next {days_ahead} days")
-                            except Exception as e:
-                                st.error(f"Failed to fetch upcoming games: {str(e)}")
-
-                elif data_mode == "Date Range":
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        start_date = st.date_input("Start Date", value=dt.date.today() - dt.timedelta(days=7))
-                    with col2:
-                        end_date = st.date_input("End Date", value=dt.date.today() + dt.timedelta(days=7))
-
-                    if st.button("Fetch Games in Date Range"):
-                        if start_date <= end_date:
-                            with st.spinner(f"Fetching NBA data from {start_date} to {end_date}..."):
-                                try:
-                                    provider = TheSportsDBProvider(season)
-                                    provider.update_specific_range(start_date, end_date)
-                                    st.success(f"Successfully fetched games from {start_date} to {end_date}")
-                                except Exception as e:
-                                    st.error(f"Failed to fetch games in date range: {str(e)}")
-                        else:
-                            st.error("End date must be after start date")
-
-                else:  # Season Backfill
-                    st.warning(f"This will attempt to fetch all games for the {season}-{season+1} season. This may not work for future seasons.")
-                    if st.button("Backfill Season Data"):
-                        with st.spinner(f"Fetching full season data for {season}-{season+1}..."):
-                            try:
-                                ingest_sportsdb(season, update_only=False)
-                                st.success(f"Successfully fetched data for {season}-{season+1} season")
-                            except Exception as e:
-                                st.error(f"Failed to backfill season data: {str(e)}")
-
-        with fetch_col2:
-            st.subheader("Other Data Sources")
-            other_source = st.selectbox(
-                "Source:",
-                options=["DraftKings Odds", "NBA Stats (Legacy)", "DraftKings Game Detail"],
-            )
-
-            if other_source == "DraftKings Game Detail":
-                event_url = st.text_input(
-                    "DraftKings event URL",
-                    placeholder="https://sportsbook.draftkings.com/event/team-vs-team/12345678"
-                )
-
-            if st.button(f"Fetch from {other_source}"):
-                if other_source == "DraftKings Odds":
-                    with st.spinner("Fetching DraftKings odds..."):
-                        try:
-                            ingest_dk_odds(season)
-                            st.success("Successfully fetched DraftKings odds")
-                        except Exception as e:
-                            st.error(f"Failed to fetch odds: {str(e)}")
-                elif other_source == "NBA Stats (Legacy)":
-                    with st.spinner("Fetching from NBA Stats API (not recommended)..."):
-                        try:
-                            ingest_nba_stats(season)
-                            st.success("Successfully fetched data from NBA Stats API")
-                        except Exception as e:
-                            st.error(f"Failed to fetch from NBA Stats API: {str(e)}")
-                            st.info("We recommend using TheSportsDB instead for more reliable data")
-                elif other_source == "DraftKings Game Detail":
-                    if not event_url:
-                        st.error("Please enter a DraftKings event URL")
-                    else:
-                        with st.spinner(f"Fetching detailed odds from DraftKings for {event_url}..."):
-                            try:
-                                fetch_event_details(event_url, season)
-                                st.success("Successfully fetched detailed odds from DraftKings!")
-                            except Exception as e:
-                                st.error(f"Failed to fetch detailed odds: {str(e)}")
+        _ingestion_tab(season)
 
     # Games tab ------------------------------------------------------------
     with tabs[1]:
-        st.header("NBA Games")
-
-        # Games filtering options
-        filter_col1, filter_col2, filter_col3 = st.columns(3)
-        with filter_col1:
-            filter_option = st.radio("Filter by:", ["Upcoming", "Recent", "All", "Date Range"])
-
-        if filter_option == "Upcoming":
-            games_df = get_upcoming_games(days=15)
-        elif filter_option == "Recent":
-            today = dt.date.today()
-            past_date = today - dt.timedelta(days=7)
-            session = SessionLocal()
-            query = (
-                select(Game)
-                .where(Game.date >= past_date)
-                .where(Game.date <= today)
-                .order_by(Game.date.desc())
-            )
-            games_df = pd.read_sql(query, session.bind)
-            session.close()
-        elif filter_option == "Date Range":
-            with filter_col2:
-                start_date = st.date_input("Start Date", value=dt.date.today() - dt.timedelta(days=7))
-            with filter_col3:
-                end_date = st.date_input("End Date", value=dt.date.today() + dt.timedelta(days=7))
-
-            session = SessionLocal()
-            try:
-                # Use explicit table aliases
-                HomeTeam = aliased(Team)
-                AwayTeam = aliased(Team)
-
-                # Build query with aliases
-                query = (
-                    select(
-                        Game.id,
-                        Game.ext_game_id,
-                        Game.season,
-                        Game.date,
-                        Game.home_team_id,
-                        Game.away_team_id,
-                        Game.venue,
-                        Game.home_score,
-                        Game.away_score,
-                        HomeTeam.name.label('home_team_name'),
-                        HomeTeam.alias.label('home_team_alias'),
-                        AwayTeam.name.label('away_team_name'),
-                        AwayTeam.alias.label('away_team_alias')
-                    )
-                    .join(HomeTeam, HomeTeam.id == Game.home_team_id)
-                    .join(AwayTeam, AwayTeam.id == Game.away_team_id)
-                    .where(Game.date >= start_date)
-                    .where(Game.date <= end_date)
-                    .order_by(Game.date)
-                )
-                games_df = pd.read_sql(query, session.bind)
-            finally:
-                session.close()
-        else:  # All
-            games_df = load_table_df(Game, season)
-
-        # Display games
-        if not games_df.empty:
-            # Enhance with team names
-            session = SessionLocal()
-            teams_df = pd.read_sql(select(Team), session.bind)
-            session.close()
-
-            # Create a mapping from team_id to team_name
-            team_map = dict(zip(teams_df['id'], teams_df['name']))
-
-            # Add team names
-            if 'home_team_id' in games_df.columns:
-                games_df['home_team'] = games_df['home_team_id'].map(team_map)
-            if 'away_team_id' in games_df.columns:
-                games_df['away_team'] = games_df['away_team_id'].map(team_map)
-
-            # Create a readable format for display
-            display_df = games_df.copy()
-            if 'home_team' in display_df.columns and 'away_team' in display_df.columns:
-                display_df['matchup'] = display_df['away_team'] + ' @ ' + display_df['home_team']
-
-            # Display the games
-            st.dataframe(display_df)
-
-            # Game selection for detailed view
-            if 'id' in games_df.columns:
-                selected_game_id = st.selectbox(
-                    "Select a game for detailed view:",
-                    options=games_df['id'].tolist(),
-                    format_func=lambda x: f"{games_df[games_df['id']==x]['away_team'].values[0]} @ {games_df[games_df['id']==x]['home_team'].values[0]} ({games_df[games_df['id']==x]['date'].values[0]})"
-                    if 'away_team' in games_df.columns and 'home_team' in games_df.columns else str(x)
-                )
-
-                if st.button("Fetch Detailed Game Data"):
-                    with st.spinner("Fetching detailed game data..."):
-                        # Here you'd implement logic to get detailed game info from the API
-                        st.info("Detailed game data fetching is not yet implemented")
-                        # Future implementation: fetch_specific_game(selected_game_id)
-        else:
-            st.info("No games found; ingest data first.")
+        _games_tab(season)
 
     # Teams tab ------------------------------------------------------------
     with tabs[2]:
-        st.header("NBA Teams")
-
-        teams_df = get_teams()
-        if not teams_df.empty:
-            st.dataframe(teams_df)
-
-            selected_team_id = st.selectbox(
-                "Select a team to view roster:",
-                options=teams_df['id'].tolist(),
-                format_func=lambda x: teams_df[teams_df['id']==x]['name'].values[0]
-            )
-
-            if st.button("Fetch Team Roster"):
-                with st.spinner(f"Fetching roster for {teams_df[teams_df['id']==selected_team_id]['name'].values[0]}..."):
-                    players_df = get_players(selected_team_id)
-                    if not players_df.empty:
-                        st.subheader(f"Roster - {teams_df[teams_df['id']==selected_team_id]['name'].values[0]}")
-                        st.dataframe(players_df)
-                    else:
-                        st.info(f"No players found for this team. Try fetching roster data first.")
-
-                        if st.button("Fetch Players from TheSportsDB"):
-                            with st.spinner("Fetching player data..."):
-                                try:
-                                    provider = TheSportsDBProvider()
-                                    provider.fetch_team_roster(selected_team_id)
-                                    st.success("Successfully fetched team roster")
-                                    # Refresh the view
-                                    players_df = get_players(selected_team_id)
-                                    if not players_df.empty:
-                                        st.dataframe(players_df)
-                                except Exception as e:
-                                    st.error(f"Failed to fetch team roster: {str(e)}")
-        else:
-            st.info("No teams found; ingest data first.")
+        _teams_tab()
 
     # Players tab ----------------------------------------------------------
     with tabs[3]:
-        st.header("NBA Players")
-
-        players_df = get_players()
-        if not players_df.empty:
-            # Add filtering options
-            filter_options = st.multiselect(
-                "Filter by team:",
-                options=get_teams()['name'].tolist()
-            )
-
-            if filter_options:
-                teams_df = get_teams()
-                team_ids = teams_df[teams_df['name'].isin(filter_options)]['id'].tolist()
-                filtered_players = players_df[players_df['team_id'].isin(team_ids)]
-                st.dataframe(filtered_players)
-
-                if not filtered_players.empty:
-                    selected_player_id = st.selectbox(
-                        "Select a player for detailed stats:",
-                        options=filtered_players['id'].tolist(),
-                        format_func=lambda x: filtered_players[filtered_players['id']==x]['name'].values[0]
-                    )
-
-                    if st.button("Fetch Player Stats"):
-                        with st.spinner("Fetching player statistics..."):
-                            # Here you would implement the player stats fetching
-                            st.info("Player statistics fetching is not yet implemented")
-                            # Future implementation: fetch_player_stats(selected_player_id)
-            else:
-                st.dataframe(players_df)
-        else:
-            st.info("No players found; ingest team rosters first.")
+        _players_tab()
 
     # Odds tab ------------------------------------------------------------
     with tabs[4]:
-        st.header("Betting Odds")
-
-        odds_df = load_table_df(OddsLine, season)
-        if not odds_df.empty:
-            # Add filtering options
-            filter_col1, filter_col2 = st.columns(2)
-
-            with filter_col1:
-                market_filter = st.selectbox(
-                    "Filter by market type:",
-                    options=["All"] + sorted(odds_df["market"].unique().tolist()),
-                )
-
-            with filter_col2:
-                sportsbook_filter = st.selectbox(
-                    "Filter by sportsbook:",
-                    options=["All"] + sorted(odds_df["sportsbook"].unique().tolist()),
-                )
-
-            # Apply filters
-            filtered_df = odds_df
-            if market_filter != "All":
-                filtered_df = filtered_df[filtered_df["market"] == market_filter]
-            if sportsbook_filter != "All":
-                filtered_df = filtered_df[filtered_df["sportsbook"] == sportsbook_filter]
-
-            # Display filtered data
-            st.dataframe(filtered_df)
-
-            # Add a section for fetching detailed odds from DraftKings
-            st.subheader("Fetch Detailed Odds from DraftKings")
-            st.info("Enter a DraftKings event URL to fetch detailed odds including player props and more.")
-
-            dk_url = st.text_input(
-                "DraftKings event URL",
-                placeholder="https://sportsbook.draftkings.com/event/team-vs-team/12345678"
-            )
-
-            if st.button("Fetch Detailed Odds"):
-                if not dk_url:
-                    st.error("Please enter a valid DraftKings event URL")
-                else:
-                    with st.spinner("Fetching detailed odds from DraftKings..."):
-                        try:
-                            fetch_event_details(dk_url, season)
-                            # Refresh the odds dataframe after fetching
-                            fresh_odds = load_table_df(OddsLine, season)
-                            st.success("Detailed odds data fetched successfully!")
-                            st.info("Refresh the page to see all new market types in the filter dropdown.")
-                        except Exception as e:
-                            st.error(f"Failed to fetch detailed odds: {str(e)}")
-
-            # Display events with existing detailed odds
-            if 'event_id' in filtered_df.columns:
-                unique_events = filtered_df.groupby('event_id')['market'].nunique().reset_index()
-                unique_events = unique_events.sort_values('market', ascending=False)
-
-                if not unique_events.empty:
-                    st.subheader("Events with Most Market Types")
-                    for _, row in unique_events.head(5).iterrows():
-                        event_id = row['event_id']
-                        market_count = row['market']
-
-                        # Try to find the teams involved
-                        event_data = filtered_df[filtered_df['event_id'] == event_id].iloc[0]
-                        event_markets = filtered_df[filtered_df['event_id'] == event_id]['market'].unique()
-
-                        if 'game_id' in event_data and event_data['game_id']:
-                            session = SessionLocal()
-                            game_data = session.execute(
-                                select(Game, Team.name.label("home_team"), Team.name.label("away_team"))
-                                .join(Team, Team.id == Game.home_team_id)
-                                .join(Team, Team.id == Game.away_team_id, isouter=True)
-                                .where(Game.id == event_data['game_id'])
-                            ).first()
-                            session.close()
-
-                            if game_data:
-                                teams_display = f"{game_data.away_team} @ {game_data.home_team}"
-                                st.markdown(f"**Event ID {event_id}**: {teams_display} ({market_count} markets)")
-
-                                # Show a sample of markets
-                                with st.expander(f"Sample of markets for {teams_display}"):
-                                    st.write(sorted(event_markets)[:10])
-        else:
-            st.info("No odds data found; ingest DraftKings odds first.")
+        _odds_tab(season)
 
     # Bets tab ------------------------------------------------------------
     with tabs[5]:
-        st.header("Bets")
-
-        bets_df = load_table_df(Bet, season)
-        if not bets_df.empty:
-            st.dataframe(bets_df)
-        else:
-            st.info("No bets found; run a simulation first.")
+        _bets_tab(season)
 
     # Simulation tab ------------------------------------------------------
     with tabs[6]:
-        st.header("Simulation")
-
-        st.subheader("Configure Simulation")
-        sim_bankroll = st.number_input(
-            "Simulation Bankroll (USD)",
-            min_value=100.0,
-            value=bankroll,
-            step=100.0,
-            format="%.2f",
-        )
-
-        if st.button("Run Simulation"):
-            with st.spinner("Running paper‑trade simulation …"):
-                final_bankroll, stats = simulate_season(int(season), float(sim_bankroll))
-            st.session_state["last_sim"] = {
-                "final_bankroll": final_bankroll,
-                "stats": stats,
-            }
-            st.success("Simulation complete.")
-
-        st.subheader("Simulation Results")
-        if "last_sim" in st.session_state:
-            sim = st.session_state["last_sim"]
-            st.metric("Final Bankroll", f"$ {sim['final_bankroll']:.2f}")
-            st.json(sim["stats"], expanded=False)
-        else:
-            st.info("Run a simulation to see results.")
-
-        # Quick counts summary
-        with SessionLocal() as sess:
-            game_count = sess.execute(select(func.count()).select_from(Game)).scalar_one()
-            team_count = sess.execute(select(func.count()).select_from(Team)).scalar_one()
-            player_count = sess.execute(select(func.count()).select_from(Player)).scalar_one()
-            odds_count = sess.execute(select(func.count()).select_from(OddsLine)).scalar_one()
-            bet_count = sess.execute(select(func.count()).select_from(Bet)).scalar_one()
-
-        col1, col2, col3 = st.columns(3)
-        col1.metric("🏀 Teams", f"{team_count}")
-        col2.metric("👤 Players", f"{player_count}")
-        col3.metric("🎮 Games", f"{game_count}")
-
-        col1, col2 = st.columns(2)
-        col1.metric("📈 Odds Lines", f"{odds_count}")
-        col2.metric("💵 Bets", f"{bet_count}")
+        _simulation_tab(season, bankroll)
 
 
 # ----------------------------------------------------------------------------